@@ -2,10 +2,12 @@ import board
 import displayio
 import adafruit_displayio_sh1106
 import gifio
+import bitmaptools
 import time
 import gc
 import os
-import digitalio
+import keypad
+import supervisor
 from adafruit_display_text import label
 import terminalio
 import busio
@@ -13,6 +15,14 @@ import wifi
 import socketpool
 import adafruit_ntp
 import rtc
+import microcontroller
+import struct
+import sys
+
+# CircuitPython 8.1 queues display SPI transfers back to back; older firmware
+# leaves idle gaps between chunks, which cost ~7% of each refresh at 8MHz
+if sys.implementation.version < (8, 1, 0):
+    print("Warning: update to CircuitPython 8.1 or newer for faster display refreshes")
 
 # Release any existing displays
 displayio.release_displays()
@@ -23,61 +33,138 @@ tft_cs = board.IO7   # Chip select (display)
 tft_dc = board.IO3   # Data/command (display)
 tft_reset = board.IO5  # Reset (display)
 
-# Initialize SPI bus at 1MHz
+# Initialize SPI bus at 8MHz (SH1106 tolerates ~8-10MHz; drop this if the
+# display shows artifacts on long jumper wires)
 display_bus = displayio.FourWire(
     spi,
     command=tft_dc,
     chip_select=tft_cs,
     reset=tft_reset,
-    baudrate=1000000
+    baudrate=8000000
 )
 
-# Initialize SH1106 display with 130 width to account for the buffer
-WIDTH = 130  # Use 130 instead of 128 to include the full buffer
+# Initialize SH1106 display. Its RAM is 132 columns wide with the visible
+# 128 starting at column 2, so let the driver offset every column write
+WIDTH = 128
 HEIGHT = 64
 display = adafruit_displayio_sh1106.SH1106(
     display_bus,
     width=WIDTH,
-    height=HEIGHT
+    height=HEIGHT,
+    colstart=2
 )
+# Refresh manually once per frame so each frame goes out in a single burst
+# instead of being split across auto-refreshes
+display.auto_refresh = False
 
-# Create a main group that applies the 2-pixel offset to ALL content
-main_group = displayio.Group(x=2, y=0)
+# Create the main group that holds the GIF or text being shown
+main_group = displayio.Group()
 display.root_group = main_group
 
-# Physical button setup
-class PhysicalButton:
-    def __init__(self, button_pin, pull=digitalio.Pull.UP):
-        self.button = digitalio.DigitalInOut(button_pin)
-        self.button.direction = digitalio.Direction.INPUT
-        self.button.pull = pull
-        self.last_state = self.button.value
-        print(f"Button on {button_pin} initialized")
-
-    def pressed(self):
-        current_state = self.button.value
-        # Detect falling edge (button press) for pull-up configuration
-        # For pull-up: pressed = False (LOW), not pressed = True (HIGH)
-        pressed = (self.last_state is True) and (current_state is False)
-        self.last_state = current_state
-        return pressed
-
-# Set up physical buttons
+# One converter and TileGrid shared by every GIF; only the bitmap is swapped
+SHARED_CC = displayio.ColorConverter(input_colorspace=displayio.Colorspace.L8)
+SHARED_TG = displayio.TileGrid(displayio.Bitmap(WIDTH, HEIGHT, 1), pixel_shader=SHARED_CC)
+main_group.append(SHARED_TG)
+
+# Black and white palette for 1-bit .rawgif frames
+MONO_PALETTE = displayio.Palette(2)
+MONO_PALETTE[0] = 0x000000
+MONO_PALETTE[1] = 0xFFFFFF
+
+def show_bitmap(bitmap, pixel_shader=SHARED_CC):
+    """Show bitmap centered on screen through the shared TileGrid"""
+    global SHARED_TG
+    if bitmap.width != SHARED_TG.tile_width or bitmap.height != SHARED_TG.tile_height:
+        # A TileGrid can only swap to a bitmap of the same size
+        SHARED_TG = displayio.TileGrid(bitmap, pixel_shader=pixel_shader)
+    else:
+        SHARED_TG.pixel_shader = pixel_shader
+        SHARED_TG.bitmap = bitmap
+    SHARED_TG.x = (WIDTH - bitmap.width) // 2 if bitmap.width < WIDTH else 0
+    SHARED_TG.y = (HEIGHT - bitmap.height) // 2 if bitmap.height < HEIGHT else 0
+
+    # Text screens replace the TileGrid, so put it back if needed
+    if len(main_group) != 1 or main_group[0] is not SHARED_TG:
+        while len(main_group) > 0:
+            main_group.pop()
+        main_group.append(SHARED_TG)
+
+# Physical button setup - keypad scans and debounces the pins in the background
+# and queues press/release events, so the main loop only has to read the queue
 try:
-    next_button = PhysicalButton(board.IO12)
-    prev_button = PhysicalButton(board.IO11)
-    mode_button = PhysicalButton(board.IO2)  # New mode button
+    keys = keypad.Keys(
+        (board.IO2, board.IO11, board.IO12),
+        value_when_pressed=False,
+        pull=True
+    )
 except Exception as e:
     print(f"Button init error: {e}")
+    keys = None
 
-# Button press cooldown to prevent spam (in seconds)
-BUTTON_COOLDOWN = 0.5
-last_button_press = 0
+# Action for each key_number, in the same order as the pins above
+KEY_ACTIONS = ("mode", "previous", "next")
 
 # Mode state
 current_mode = "gif"  # Start in GIF mode
 
 # WiFi and time setup
+NTP_RESYNC_INTERVAL = 3600  # Seconds between NTP resyncs (RTC drifts ~1-2s/day)
+NTP_SKIP_AGE = 43200  # Skip the boot-time sync if the RTC was synced this recently
+ntp = None
+last_ntp_sync = None  # time.monotonic() of the last sync attempt
+
+# WiFi details from settings.toml, filled in below
+ssid = None
+password = None
+tz_offset = 0
+
+# The clock is shown as base_epoch plus the monotonic time elapsed since
+# base_mono_ns, so each tick is just arithmetic
+base_epoch = time.time()
+base_mono_ns = time.monotonic_ns()
+
+# The epoch of the last successful sync is kept in nvm[0:4] and the timezone
+# offset it used in nvm[4], so a soft reset (which keeps the RTC running)
+# doesn't have to wait on WiFi and NTP again unless the timezone changed
+def read_last_sync():
+    """Return (epoch, tz_offset) of the last successful sync"""
+    try:
+        return struct.unpack("<Ib", microcontroller.nvm[0:5])
+    except Exception:
+        return 0, 0
+
+def save_last_sync(epoch):
+    try:
+        microcontroller.nvm[0:5] = struct.pack("<Ib", epoch, tz_offset)
+    except Exception as e:
+        print(f"Failed to save sync time: {e}")
+
+def sync_time():
+    """Set the RTC from NTP and re-base the clock on it"""
+    global ntp, last_ntp_sync, base_epoch, base_mono_ns
+    last_ntp_sync = time.monotonic()
+    if ntp is None:
+        wifi.radio.connect(ssid, password)
+        pool = socketpool.SocketPool(wifi.radio)
+        # Short timeout so a resync can't stall the clock for long
+        ntp = adafruit_ntp.NTP(pool, tz_offset=tz_offset, socket_timeout=2)
+    rtc.RTC().datetime = ntp.datetime
+    base_epoch = time.time()
+    base_mono_ns = time.monotonic_ns()
+    save_last_sync(base_epoch)
+
+def resync_time_if_due():
+    """Resync from NTP once NTP_RESYNC_INTERVAL has passed since the last try"""
+    if not (ssid and password):
+        return
+    if last_ntp_sync is not None and time.monotonic() - last_ntp_sync < NTP_RESYNC_INTERVAL:
+        return
+    try:
+        sync_time()
+        print("Time resynchronized via NTP")
+    except Exception as e:
+        print(f"Failed to resync time: {e}")
+
 try:
     # Get WiFi details from settings.toml
     ssid = os.getenv("CIRCUITPY_WIFI_SSID")
@@ -88,45 +175,80 @@ try:
     tz_offset = int(tz_offset_str)
     
     if ssid and password:
-        wifi.radio.connect(ssid, password)
-        pool = socketpool.SocketPool(wifi.radio)
-        ntp = adafruit_ntp.NTP(pool, tz_offset=tz_offset)
-        rtc.RTC().datetime = ntp.datetime
-        print(f"Time synchronized via NTP (Timezone offset: {tz_offset} hours)")
+        last_sync, last_tz_offset = read_last_sync()
+        sync_age = time.time() - last_sync
+        if last_tz_offset == tz_offset and 0 <= sync_age < NTP_SKIP_AGE:
+            # RTC still holds recently synced time, resync later in the background
+            last_ntp_sync = time.monotonic() - sync_age
+            print(f"RTC synchronized {sync_age}s ago, skipping NTP")
+        else:
+            sync_time()
+            print(f"Time synchronized via NTP (Timezone offset: {tz_offset} hours)")
     else:
         print("WiFi credentials not found in settings.toml")
 except Exception as e:
     print(f"Failed to sync time: {e}")
 
 # Create clock display elements once (not every second)
-time_label = label.Label(terminalio.FONT, text="00:00:00", color=0xFFFFFF)
+# HH:MM and :SS AM are separate labels so the larger one is only re-rendered
+# once a minute; terminalio glyphs are 6px wide
+time_label = label.Label(terminalio.FONT, text="00:00", color=0xFFFFFF)
 time_label.x = 10
 time_label.y = HEIGHT // 2 - 10
 
+sec_label = label.Label(terminalio.FONT, text=":00 AM", color=0xFFFFFF)
+sec_label.x = time_label.x + 5 * 6
+sec_label.y = time_label.y
+
 date_label = label.Label(terminalio.FONT, text="YYYY-MM-DD", color=0xFFFFFF)
 date_label.x = 10
 date_label.y = HEIGHT // 2 + 10
 
 clock_group = displayio.Group()
 clock_group.append(time_label)
+clock_group.append(sec_label)
 clock_group.append(date_label)
 
+# Zero-padded "00".."59" so ticks concatenate strings instead of formatting
+TWO_DIGITS = tuple("%02d" % i for i in range(60))
+
+# Last text shown on each clock label, to skip re-rendering unchanged labels
+last_time_str = None
+last_sec_str = None
+last_date_str = None
+last_epoch = None
+
 def update_clock_display():
     """Update the clock display with current time (no flicker)"""
+    global last_time_str, last_sec_str, last_date_str, last_epoch
     try:
-        now = time.localtime()
+        epoch = base_epoch + (time.monotonic_ns() - base_mono_ns) // 1000000000
+        if epoch == last_epoch:
+            return
+        last_epoch = epoch
+        now = time.localtime(epoch)
         
         # Format time as HH:MM:SS
         hour_12 = now.tm_hour % 12
         if hour_12 == 0:
             hour_12 = 12
         period = "AM" if now.tm_hour < 12 else "PM"
-        time_str = "{:02d}:{:02d}:{:02d} {}".format(hour_12, now.tm_min, now.tm_sec, period)
-        time_label.text = time_str
+        time_str = TWO_DIGITS[hour_12] + ":" + TWO_DIGITS[now.tm_min]
+        if time_str != last_time_str:
+            time_label.text = time_str
+            last_time_str = time_str
+
+        sec_str = ":" + TWO_DIGITS[now.tm_sec] + " " + period
+        if sec_str != last_sec_str:
+            sec_label.text = sec_str
+            last_sec_str = sec_str
         
         # Format date as YYYY-MM-DD
-        date_str = "{:04d}-{:02d}-{:02d}".format(now.tm_year, now.tm_mon, now.tm_mday)
-        date_label.text = date_str
+        date_str = str(now.tm_year) + "-" + TWO_DIGITS[now.tm_mon] + "-" + TWO_DIGITS[now.tm_mday]
+        if date_str != last_date_str:
+            date_label.text = date_str
+            last_date_str = date_str
+        display.refresh()
         
     except Exception as e:
         print(f"Error updating clock: {e}")
@@ -138,52 +260,77 @@ def switch_mode():
         current_mode = "clock"
         display.root_group = clock_group
         update_clock_display()  # Update immediately when switching to clock
+        display.refresh()
         print("Switched to Clock mode")
     else:
         current_mode = "gif"
         display.root_group = main_group
         print("Switched to GIF mode")
 
-# Function to play A0.gif for the same duration as the original wait
-def show_interstitial():
-    interstitial_path = "/gifs/z9loader.gif"
+# Frame timing uses supervisor.ticks_ms(), which returns a small int instead
+# of allocating a float like time.monotonic(). It wraps every 2**29 ms, so
+# compare ticks with these helpers (from the supervisor docs).
+TICKS_PERIOD = 1 << 29
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
 
-    try:
-        # Check if A0.gif exists
-        try:
-            odg = gifio.OnDiskGif(interstitial_path)
-        except:
-            # If A0.gif doesn't exist, fall back to text
-            show_please_wait()
-            return
+def ticks_add(ticks, delta):
+    """Add a delta to a base number of ticks, performing wraparound at 2**29ms"""
+    return (ticks + delta) % TICKS_PERIOD
 
-        face = displayio.TileGrid(
-            odg.bitmap,
-            pixel_shader=displayio.ColorConverter(
-                input_colorspace=displayio.Colorspace.L8
-            ),
-            x=0,
-            y=0
-        )
+def ticks_diff(ticks1, ticks2):
+    """Compute the signed difference between two ticks values"""
+    diff = (ticks1 - ticks2) & TICKS_MAX
+    return ((diff + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
 
-        while len(main_group) > 0:
-            main_group.pop()
-        main_group.append(face)
-
-        # Play A0.gif for approximately 2 seconds (same as original wait)
-        start_time = time.monotonic()
-        next_delay = odg.next_frame()
-        frame_start = start_time
-
-        while time.monotonic() - start_time < 2.0:  # Play for 2 seconds
-            elapsed = time.monotonic() - frame_start
-            if elapsed >= next_delay:
-                frame_start = time.monotonic()
-                next_delay = odg.next_frame()
-            else:
-                time.sleep(0.001)
+# Open the interstitial once at boot and keep it open; it just keeps looping
+# from whichever frame it stopped on
+try:
+    INTERSTITIAL = gifio.OnDiskGif("/gifs/z9loader.gif")
+except Exception as e:
+    print(f"Interstitial not available: {e}")
+    INTERSTITIAL = None
+
+# Function to play A0.gif for the same duration as the original wait.
+# The upcoming GIF is opened and decoded into the frame cache between loader
+# frames, so it can start straight away; the CachedGif (or the open file if
+# it is too big to cache, or None) is returned for play_gif to use.
+def show_interstitial(next_path=None):
+    # Start the 2 second window first so opening the next GIF happens inside it
+    end_time = ticks_add(supervisor.ticks_ms(), 2000)
+
+    next_gif = None
+    if next_path:
+        next_gif = get_cached_gif(next_path)
+        if next_gif is None:
+            try:
+                next_gif = open_gif_evicting(next_path)
+                next_gif = start_caching(next_path, next_gif) or next_gif
+            except Exception as e:
+                print(f"Error opening {next_path}: {e}")
+
+    try:
+        # If A0.gif doesn't exist, fall back to text
+        if INTERSTITIAL is None:
+            show_please_wait()
+            return next_gif
+
+        show_bitmap(INTERSTITIAL.bitmap)
+
+        # Play A0.gif for the rest of the 2 seconds (same as original wait)
+        while ticks_diff(end_time, supervisor.ticks_ms()) > 0:
+            frame_start = supervisor.ticks_ms()
+            next_wake = ticks_add(frame_start, int(INTERSTITIAL.next_frame() * 1000))
+            if ticks_diff(next_wake, end_time) > 0:
+                next_wake = end_time
+            display.refresh()
+            # Use the time until the next loader frame to decode the next GIF
+            if isinstance(next_gif, CachedGif):
+                next_gif = cache_frames_until(next_gif, next_wake)
+            sleep_ms = ticks_diff(next_wake, supervisor.ticks_ms())
+            if sleep_ms > 0:
+                time.sleep(sleep_ms / 1000)
 
-        odg.deinit()
         gc.collect()
 
     except Exception as e:
@@ -191,6 +338,8 @@ def show_interstitial():
         # Fallback to text if there's an error
         show_please_wait()
 
+    return next_gif
+
 # Keep the original please wait function as fallback
 def show_please_wait():
     while len(main_group) > 0:
@@ -202,95 +351,292 @@ def show_please_wait():
     text_area.y = HEIGHT // 2
 
     main_group.append(text_area)
+    display.refresh()
     time.sleep(2.0)
 
-# Enhanced button checking function
-def button_pressed():
-    global last_button_press
-
-    current_time = time.monotonic()
-    if current_time - last_button_press < BUTTON_COOLDOWN:
-        return False, None
-
-    try:
-        next_pressed = next_button.pressed()
-        prev_pressed = prev_button.pressed()
-        mode_pressed = mode_button.pressed()
-
-        # Debug output (comment out in production)
-        # print(f"Buttons - Next: {next_pressed}, Prev: {prev_pressed}, Mode: {mode_pressed}")
-
-        if mode_pressed:
-            last_button_press = current_time
-            return True, "mode"
-        elif next_pressed and not prev_pressed:
-            last_button_press = current_time
-            return True, "next"
-        elif prev_pressed and not next_pressed:
-            last_button_press = current_time
-            return True, "previous"
-
-    except Exception as e:
-        print(f"Button read error: {e}")
+# Return the action for the next queued button press, if any
+def get_button_action():
+    if keys is None:
+        return None
+    event = keys.events.get()
+    while event:
+        if event.pressed:
+            return KEY_ACTIONS[event.key_number]
+        event = keys.events.get()
+    return None
+
+# Free heap (bytes) below which a collection is forced between frames
+GC_LOW_WATER = 32 * 1024
+
+# Sleep until next_wake (in ticks_ms), checking the buttons once first so a
+# press is handled within one frame. Returns the button action, if any.
+def wait_for_next_frame(next_wake):
+    direction = get_button_action()
+    if direction:
+        print(f"Button pressed - {direction}")
+        return direction
+
+    # Automatic GC is off, so collect here if the heap is running low
+    if gc.mem_free() < GC_LOW_WATER:
+        gc.collect()
 
-    return False, None
+    sleep_ms = ticks_diff(next_wake, supervisor.ticks_ms())
+    if sleep_ms > 0:
+        time.sleep(sleep_ms / 1000)
+    return None
+
+# Frame bundle written by tools/gif2rawgif.py: a <HHH width, height, frame
+# count header, then per frame a <H delay in ms followed by the frame's 1-bit
+# pixels in displayio.Bitmap's own layout (rows of little-endian 32-bit words,
+# leftmost pixel in the top bit). Frames are read straight into the bitmap,
+# so no LZW decoding happens on the board.
+class RawGif:
+    """Plays a .rawgif file with the same interface as gifio.OnDiskGif"""
+    value_count = 2  # Pixels are black or white
+    pixel_shader = MONO_PALETTE
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.width, self.height, self.frame_count = struct.unpack("<HHH", self.file.read(6))
+        self.bitmap = displayio.Bitmap(self.width, self.height, self.value_count)
+        self.delay = bytearray(2)
+
+    def next_frame(self):
+        """Read the next frame into bitmap and return its delay in seconds"""
+        if self.file.readinto(self.delay) < 2:
+            # End of the bundle, loop back to the first frame
+            self.file.seek(6)
+            self.file.readinto(self.delay)
+        self.file.readinto(self.bitmap)
+        self.bitmap.dirty()
+        return (self.delay[0] | self.delay[1] << 8) / 1000
+
+    def deinit(self):
+        self.file.close()
+
+def open_gif(gif_path):
+    """Open a .gif with gifio or a pre-converted .rawgif with RawGif"""
+    if gif_path.endswith(".rawgif"):
+        return RawGif(gif_path)
+    return gifio.OnDiskGif(gif_path)
+
+# Last filtered and sorted listing, reused while os.listdir() returns exactly
+# the same names (FatFs doesn't update a directory's mtime when files change)
+gif_list_cache = {"names": None, "files": []}
 
 def get_gif_files():
     gif_dir = "/gifs"
-    files = []
 
     try:
         os.mkdir(gif_dir)
     except OSError:
         pass
 
-    for file in os.listdir(gif_dir):
-        if file.lower().endswith('.gif'):
-            files.append(f"{gif_dir}/{file}")
-
-    return sorted(files)
-
-def play_gif(gif_path):
+    names = os.listdir(gif_dir)
+    if names == gif_list_cache["names"]:
+        return gif_list_cache["files"]
+    gif_list_cache["names"] = names[:]
+
+    # Sort the bare names in place (same order as the full paths) and then
+    # filter and build the paths in a single pass. A .rawgif is a converted
+    # GIF, so it replaces the .gif of the same name.
+    names.sort()
+    name_set = set(names)
+    files = [f"{gif_dir}/{file}" for file in names
+             if file.endswith(".rawgif")
+             or (file[-4:].lower() == ".gif" and file[:-4] + ".rawgif" not in name_set)]
+
+    gif_list_cache["files"] = files
+    return files
+
+# Decoded GIF frames kept in PSRAM so looping GIFs are only LZW-decoded once
+GIF_CACHE_SIZE = 2  # Number of GIFs kept decoded at a time
+gif_cache = {}  # path -> fully decoded CachedGif
+gif_cache_order = []  # Least recently used path first
+
+class CachedGif:
+    """A GIF copied into RAM one frame at a time as it is first played. Once
+    the last frame is in, it is added to gif_cache and its file is closed."""
+
+    def __init__(self, path, odg, cache_bytes):
+        self.path = path
+        self.odg = odg
+        self.frame_count = odg.frame_count
+        self.pixel_shader = getattr(odg, "pixel_shader", SHARED_CC)
+        self.cache_bytes = cache_bytes
+        self.bitmaps = []
+        self.delays = []  # ms
+
+    @property
+    def complete(self):
+        return len(self.bitmaps) == self.frame_count
+
+    def decode_next_frame(self):
+        """Decode the next frame from odg into a new bitmap"""
+        odg = self.odg
+        delay = int(odg.next_frame() * 1000)
+        # gifio bitmaps are 16-bit RGB565; RawGif says how deep it is
+        frame = displayio.Bitmap(odg.width, odg.height, getattr(odg, "value_count", 65536))
+        bitmaptools.blit(frame, odg.bitmap, 0, 0)
+        self.bitmaps.append(frame)
+        self.delays.append(delay)
+
+        if self.complete:
+            self.deinit()
+            gif_cache[self.path] = self
+            gif_cache_order.append(self.path)
+
+    def deinit(self):
+        """Close the file; frames decoded so far stay usable"""
+        if self.odg is not None:
+            try:
+                self.odg.deinit()
+            except Exception:
+                pass
+            self.odg = None
+
+def get_cached_gif(gif_path):
+    """Return the cached GIF for gif_path, marking it most recently used"""
+    gif = gif_cache.get(gif_path)
+    if gif is not None:
+        gif_cache_order.remove(gif_path)
+        gif_cache_order.append(gif_path)
+    return gif
+
+def clear_gif_cache():
+    gif_cache.clear()
+    del gif_cache_order[:]
+
+def start_caching(gif_path, odg):
+    """Return a CachedGif to fill from odg, evicting older GIFs to make room,
+    or None if its frames can't fit in RAM even with the cache emptied"""
+    # gifio bitmaps are 16-bit RGB565; RawGif says how deep it is
+    value_count = getattr(odg, "value_count", 65536)
+    bits_per_pixel = 16 if value_count > 256 else 8 if value_count > 2 else 1
+    # Bitmap rows are padded to 32-bit words
+    frame_bytes = odg.height * ((odg.width * bits_per_pixel + 31) // 32 * 4)
+    cache_bytes = odg.frame_count * frame_bytes
+
+    free = gc.mem_free()
+    if cache_bytes + GC_LOW_WATER > free + sum(gif.cache_bytes for gif in gif_cache.values()):
+        return None
+
+    # Evict until there is a free slot and enough RAM for the new frames
+    while gif_cache_order and (len(gif_cache_order) >= GIF_CACHE_SIZE
+                               or cache_bytes + GC_LOW_WATER > free):
+        free += gif_cache.pop(gif_cache_order.pop(0)).cache_bytes
+    gc.collect()
+
+    return CachedGif(gif_path, odg, cache_bytes)
+
+def cache_frames_until(gif, deadline):
+    """Decode frames of a partly cached GIF until it is complete or deadline
+    (in ticks_ms) passes. Returns gif, or its open file if RAM ran out."""
+    while not gif.complete and ticks_diff(deadline, supervisor.ticks_ms()) > 0:
+        try:
+            gif.decode_next_frame()
+        except MemoryError:
+            print(f"Not enough RAM to cache {gif.path}, streaming")
+            odg = gif.odg
+            gif.odg = None
+            clear_gif_cache()
+            gc.collect()
+            return odg
+    return gif
+
+def open_gif_evicting(gif_path):
+    """open_gif, emptying the frame cache and retrying once if RAM runs out"""
     try:
-        odg = gifio.OnDiskGif(gif_path)
+        return open_gif(gif_path)
+    except MemoryError:
+        # Automatic GC is off and the cache can fill the heap
+        print(f"Not enough RAM to open {gif_path}, clearing frame cache")
+        clear_gif_cache()
+        gc.collect()
+        return open_gif(gif_path)
 
-        face = displayio.TileGrid(
-            odg.bitmap,
-            pixel_shader=displayio.ColorConverter(
-                input_colorspace=displayio.Colorspace.L8
-            ),
-            x=(128 - odg.bitmap.width) // 2 if odg.bitmap.width < 128 else 0,
-            y=(64 - odg.bitmap.height) // 2 if odg.bitmap.height < 64 else 0
-        )
+def play_cached_gif(gif):
+    """Play a CachedGif from its first frame, decoding the frames it doesn't
+    have yet as they come up. Returns the button action, or None if RAM ran
+    out while caching and the rest has to be streamed from gif.odg."""
+    frame_index = 0
+    while True:
+        # Decode time counts against the frame's delay
+        frame_start = supervisor.ticks_ms()
+        if frame_index == len(gif.bitmaps):
+            try:
+                gif.decode_next_frame()
+            except MemoryError:
+                return None
+
+        if frame_index == 0:
+            show_bitmap(gif.bitmaps[0], gif.pixel_shader)
+        else:
+            SHARED_TG.bitmap = gif.bitmaps[frame_index]
+        next_wake = ticks_add(frame_start, gif.delays[frame_index])
+        display.refresh()
+
+        direction = wait_for_next_frame(next_wake)
+        if direction:
+            return direction
+
+        frame_index = (frame_index + 1) % gif.frame_count
+
+def play_gif(gif_path, gif=None):
+    """Play gif_path until a button is pressed. gif may be the GIF already
+    opened (and possibly partly cached) by show_interstitial."""
+    odg = None
+    try:
+        if gif is None:
+            gif = get_cached_gif(gif_path)
+        if gif is None:
+            gif = open_gif_evicting(gif_path)
+        if not isinstance(gif, CachedGif):
+            odg = gif
+            gif = start_caching(gif_path, odg)
+
+        if gif is not None:
+            direction = play_cached_gif(gif)
+            if direction:
+                return direction
 
-        while len(main_group) > 0:
-            main_group.pop()
-        main_group.append(face)
+            # Ran out of RAM partway through caching, stream the rest
+            print(f"Not enough RAM to cache {gif_path}, streaming")
+            odg = gif.odg
+            gif.odg = None
+            gif = None
+            clear_gif_cache()
+            gc.collect()
 
-        next_delay = odg.next_frame()
-        start_time = time.monotonic()
+        # Too big to keep in RAM, stream it from disk instead
+        show_bitmap(odg.bitmap, getattr(odg, "pixel_shader", SHARED_CC))
 
         while True:
-            pressed, direction = button_pressed()
-            if pressed:
-                print(f"Button pressed - {direction}")
-                return direction
-
-            elapsed = time.monotonic() - start_time
-            if elapsed >= next_delay:
-                start_time = time.monotonic()
-                next_delay = odg.next_frame()
-            else:
-                time.sleep(0.001)
+            # Decode time counts against the frame's delay
+            frame_start = supervisor.ticks_ms()
+            next_wake = ticks_add(frame_start, int(odg.next_frame() * 1000))
+            display.refresh()
 
-        odg.deinit()
-        gc.collect()
-        return True
+            direction = wait_for_next_frame(next_wake)
+            if direction:
+                return direction
 
     except Exception as e:
         print(f"Error playing {gif_path}: {e}")
         return "error"
 
+    finally:
+        # Release the file handle and decode buffers right away; the main
+        # loop collects the garbage once play_gif returns. A partly cached
+        # GIF is dropped since its file is closed.
+        if gif is not None:
+            gif.deinit()
+        elif odg is not None:
+            try:
+                odg.deinit()
+            except Exception:
+                pass
+
 def show_error(message):
     while len(main_group) > 0:
         main_group.pop()
@@ -300,11 +646,13 @@ def show_error(message):
     text_area.y = HEIGHT // 2
 
     main_group.append(text_area)
+    display.refresh()
     time.sleep(2)
 
 # Main loop
 gif_files = get_gif_files()
 current_gif_index = 0
+next_gif = None  # Next GIF, opened and cached while the interstitial plays
 
 if not gif_files:
     show_error("No GIFs in /gifs")
@@ -313,42 +661,55 @@ if not gif_files:
 else:
     print(f"Found {len(gif_files)} GIFs")
 
-    # Initial setup period for buttons
-    print("Initializing buttons...")
-    time.sleep(1)
+    # Drop any presses queued while booting
+    if keys is not None:
+        keys.events.clear()
+
+    # Only collect garbage between frames and GIF swaps so GC pauses never
+    # land in the middle of decoding a frame
+    gc.collect()
+    gc.disable()
 
     while True:
         try:
             if current_mode == "gif":
                 print(f"Playing GIF {current_gif_index + 1}/{len(gif_files)}")
 
-                result = play_gif(gif_files[current_gif_index])
+                result = play_gif(gif_files[current_gif_index], next_gif)
+                next_gif = None
+                gc.collect()
 
                 if result == "next":
-                    show_interstitial()
                     current_gif_index = (current_gif_index + 1) % len(gif_files)
+                    next_gif = show_interstitial(gif_files[current_gif_index])
                     print(f"Switching to next GIF: {current_gif_index + 1}/{len(gif_files)}")
                 elif result == "previous":
-                    show_interstitial()
                     current_gif_index = (current_gif_index - 1) % len(gif_files)
+                    next_gif = show_interstitial(gif_files[current_gif_index])
                     print(f"Switching to previous GIF: {current_gif_index + 1}/{len(gif_files)}")
                 elif result == "mode":
                     switch_mode()
                 else:
-                    show_interstitial()
                     current_gif_index = (current_gif_index + 1) % len(gif_files)
+                    next_gif = show_interstitial(gif_files[current_gif_index])
                     print(f"Error with current GIF, trying next: {current_gif_index + 1}/{len(gif_files)}")
             else:
                 # Clock mode - update time every second without flickering
                 update_clock_display()
+                resync_time_if_due()
+                gc.collect()
                 time.sleep(1)
                 
                 # Check for mode button press in clock mode
-                pressed, direction = button_pressed()
-                if pressed and direction == "mode":
+                if get_button_action() == "mode":
                     switch_mode()
 
         except Exception as e:
             print(f"Fatal error in main loop: {e}")
             show_error("Fatal error, resetting")
             current_gif_index = 0
+            if next_gif is not None:
+                next_gif.deinit()
+                next_gif = None
+            # Pick up GIFs added or removed since boot
+            gif_files = get_gif_files() or gif_files
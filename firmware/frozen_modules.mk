@@ -0,0 +1,6 @@
+# Append to ports/espressif/boards/lolin_s2_mini/mpconfigboard.mk in a
+# CircuitPython checkout to freeze the libraries code.py imports. Frozen
+# bytecode runs from flash instead of being loaded into the heap at boot.
+FROZEN_MPY_DIRS += $(TOP)/frozen/Adafruit_CircuitPython_DisplayIO_SH1106
+FROZEN_MPY_DIRS += $(TOP)/frozen/Adafruit_CircuitPython_Display_Text
+FROZEN_MPY_DIRS += $(TOP)/frozen/Adafruit_CircuitPython_NTP
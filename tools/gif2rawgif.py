@@ -0,0 +1,60 @@
+"""Convert GIFs into .rawgif frame bundles for code.py.
+
+Run this on a computer (it needs Pillow), not on the board:
+
+    python tools/gif2rawgif.py gifs/*.gif
+
+Each GIF is written next to the original with a .rawgif extension. The
+player prefers a .rawgif over a .gif of the same name, and reads its
+frames straight into a bitmap instead of LZW-decoding them on the board.
+
+Format (little endian): a <HHH width, height, frame count header, then
+for each frame a <H delay in ms followed by the frame's pixels at 1 bit
+per pixel (1 = white), in the layout displayio.Bitmap uses for 1-bit
+bitmaps: each row is a run of little-endian 32-bit words, padded at the
+end, with the leftmost pixel of each word in its most significant bit.
+A 128x64 frame is 1KB.
+"""
+import os
+import struct
+import sys
+
+from PIL import Image, ImageSequence
+
+
+def convert(gif_path):
+    raw_path = os.path.splitext(gif_path)[0] + ".rawgif"
+    with Image.open(gif_path) as gif:
+        width, height = gif.size
+        row_bytes = (width + 7) // 8
+        stride = (width + 31) // 32 * 4
+        frames = []
+        for frame in ImageSequence.Iterator(gif):
+            delay = min(frame.info.get("duration", 100), 0xFFFF)
+            # Threshold to black and white; mode "1" packs 8 pixels per byte
+            # with the leftmost pixel in the top bit
+            mono = frame.convert("L").point(lambda v: 255 if v >= 128 else 0, "1")
+            pixels = mono.tobytes()
+            rows = []
+            for y in range(height):
+                row = pixels[y * row_bytes:(y + 1) * row_bytes].ljust(stride, b"\0")
+                # Byte-swap each 32-bit word so it reads back little endian
+                rows.extend(row[i:i + 4][::-1] for i in range(0, stride, 4))
+            frames.append(struct.pack("<H", delay) + b"".join(rows))
+
+    if not frames:
+        raise ValueError(f"{gif_path} has no frames")
+
+    with open(raw_path, "wb") as f:
+        f.write(struct.pack("<HHH", width, height, len(frames)))
+        for frame in frames:
+            f.write(frame)
+
+    print(f"{gif_path} -> {raw_path} ({len(frames)} frames)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python tools/gif2rawgif.py GIF [GIF ...]")
+    for path in sys.argv[1:]:
+        convert(path)